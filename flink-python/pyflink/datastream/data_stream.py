@@ -563,8 +563,8 @@ class DataStream(object):
             # a custom Operator.
             from pyflink.fn_execution import flink_fn_execution_pb2 as ffpb2
             gateway = get_gateway()
-            import cloudpickle
-            serialized_func = cloudpickle.dumps(watermark_strategy._timestamp_assigner)
+            from pyflink.fn_execution import pickle
+            serialized_func = pickle.dumps(watermark_strategy._timestamp_assigner)
             JDataStreamPythonFunction = gateway.jvm.DataStreamPythonFunction
             j_data_stream_python_function = JDataStreamPythonFunction(
                 bytearray(serialized_func),
@@ -1517,8 +1517,8 @@ def _get_one_input_stream_operator(data_stream: DataStream,
     """
 
     gateway = get_gateway()
-    import cloudpickle
-    serialized_func = cloudpickle.dumps(func)
+    from pyflink.fn_execution import pickle
+    serialized_func = pickle.dumps(func)
     j_input_types = data_stream._j_data_stream.getTransformation().getOutputType()
     if output_type is None:
         output_type_info = Types.PICKLED_BYTE_ARRAY()  # type: TypeInformation
@@ -1587,8 +1587,8 @@ def _get_two_input_stream_operator(connected_streams: ConnectedStreams,
     """
 
     gateway = get_gateway()
-    import cloudpickle
-    serialized_func = cloudpickle.dumps(func)
+    from pyflink.fn_execution import pickle
+    serialized_func = pickle.dumps(func)
 
     j_input_types1 = connected_streams.stream1._j_data_stream.getTransformation().getOutputType()
     j_input_types2 = connected_streams.stream2._j_data_stream.getTransformation().getOutputType()
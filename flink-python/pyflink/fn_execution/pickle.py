@@ -15,14 +15,35 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import zlib
 from threading import RLock
 
 import cloudpickle
 
 _lock = RLock()
 
+# pickled payloads larger than this are compressed before being sent to the JVM
+_COMPRESSION_THRESHOLD = 64 * 1024
+
+# the first byte of a zlib stream, a pickled payload always starts with 0x80 instead
+_ZLIB_HEADER = 0x78
+
+
+def dumps(obj):
+    """
+    Pickles the given user-defined function. Large payloads, e.g. functions capturing model
+    weights, are zlib compressed, as the payload is transferred through Py4J and shipped to the
+    Python workers as is.
+    """
+    payload = cloudpickle.dumps(obj)
+    if len(payload) > _COMPRESSION_THRESHOLD:
+        payload = zlib.compress(payload)
+    return payload
+
 
 def loads(payload):
+    if payload[0] == _ZLIB_HEADER:
+        payload = zlib.decompress(payload)
     with _lock:
         # there is race condition for pickle.load() used in multi-thread environment,
         # see https://bugs.python.org/issue36773 for more details.
@@ -0,0 +1,44 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import logging
+import unittest
+
+import cloudpickle
+
+from pyflink.fn_execution import pickle
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class PickleTest(PyFlinkTestCase):
+
+    def test_small_payload(self):
+        payload = pickle.dumps(lambda i: i + 1)
+        self.assertEqual(0x80, payload[0])
+        self.assertEqual(2, pickle.loads(payload)(1))
+
+    def test_large_payload(self):
+        weights = list(range(100000))
+        payload = pickle.dumps(lambda i: weights[i])
+        self.assertEqual(0x78, payload[0])
+        self.assertLess(len(payload), len(cloudpickle.dumps(weights)))
+        self.assertEqual(99999, pickle.loads(payload)(-1))
+
+
+if __name__ == '__main__':
+    logging.getLogger().setLevel(logging.INFO)
+    unittest.main()
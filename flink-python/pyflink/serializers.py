@@ -132,8 +132,8 @@ class BatchedSerializer(IterableSerializer):
 
     def _batched(self, iterable):
         if self.batch_size == self.UNLIMITED_BATCH_SIZE:
-            yield list(iterable)
-        elif hasattr(iterable, "__len__") and hasattr(iterable, "__getslice__"):
+            yield iterable if isinstance(iterable, list) else list(iterable)
+        elif isinstance(iterable, (list, tuple)):
             n = len(iterable)
             for i in range(0, n, self.batch_size):
                 yield iterable[i: i + self.batch_size]
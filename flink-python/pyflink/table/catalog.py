@@ -22,6 +22,7 @@ from py4j.java_gateway import java_import
 from pyflink.java_gateway import get_gateway
 from pyflink.table.schema import Schema
 from pyflink.table.table_schema import TableSchema
+from pyflink.util.java_utils import from_j_string_list
 
 __all__ = ['Catalog', 'CatalogDatabase', 'CatalogBaseTable', 'CatalogPartition', 'CatalogFunction',
            'ObjectPath', 'CatalogPartitionSpec', 'CatalogTableStatistics',
@@ -56,7 +57,7 @@ class Catalog(object):
         :return: A list of the names of all databases.
         :raise: CatalogException in case of any runtime exception.
         """
-        return list(self._j_catalog.listDatabases())
+        return from_j_string_list(self._j_catalog.listDatabases())
 
     def get_database(self, database_name: str) -> 'CatalogDatabase':
         """
@@ -134,7 +135,7 @@ class Catalog(object):
         :raise: CatalogException in case of any runtime exception.
                 DatabaseNotExistException if the database does not exist.
         """
-        return list(self._j_catalog.listTables(database_name))
+        return from_j_string_list(self._j_catalog.listTables(database_name))
 
     def list_views(self, database_name: str) -> List[str]:
         """
@@ -145,7 +146,7 @@ class Catalog(object):
         :raise: CatalogException in case of any runtime exception.
                 DatabaseNotExistException if the database does not exist.
         """
-        return list(self._j_catalog.listViews(database_name))
+        return from_j_string_list(self._j_catalog.listViews(database_name))
 
     def get_table(self, table_path: 'ObjectPath') -> 'CatalogBaseTable':
         """
@@ -354,7 +355,7 @@ class Catalog(object):
         :raise: CatalogException in case of any runtime exception.
                 DatabaseNotExistException if the database does not exist.
         """
-        return list(self._j_catalog.listFunctions(database_name))
+        return from_j_string_list(self._j_catalog.listFunctions(database_name))
 
     def get_function(self, function_path: 'ObjectPath') -> 'CatalogFunction':
         """
@@ -57,26 +57,27 @@ class ModuleEntry(object):
     """
 
     def __init__(self, name: str, used: bool, j_module_entry=None):
-        if j_module_entry is None:
-            gateway = get_gateway()
-            self._j_module_entry = gateway.jvm.org.apache.flink.table.module.ModuleEntry(name, used)
-        else:
-            self._j_module_entry = j_module_entry
+        if j_module_entry is not None:
+            name = j_module_entry.name()
+            used = j_module_entry.used()
+        self._name = name
+        self._used = used
 
     def name(self) -> str:
-        return self._j_module_entry.name()
+        return self._name
 
     def used(self) -> bool:
-        return self._j_module_entry.used()
+        return self._used
 
     def __repr__(self):
-        return self._j_module_entry.toString()
+        return "ModuleEntry{name='%s', used=%s}" % (self._name, str(self._used).lower())
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self._j_module_entry == other._j_module_entry
+        return isinstance(other, self.__class__) and self._name == other._name \
+            and self._used == other._used
 
     def __hash__(self):
-        return self._j_module_entry.hashCode()
+        return hash((self._name, self._used))
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -15,13 +15,17 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import io
 import os
+import pickle
 import sys
 import tempfile
 import warnings
+from functools import lru_cache
+from warnings import warn as _warn
 from typing import Union, List, Tuple, Iterable
 
-from py4j.java_gateway import get_java_class, get_method
+from py4j.java_gateway import get_method
 
 from pyflink.datastream import StreamExecutionEnvironment
 from pyflink.table.sources import TableSource
@@ -40,21 +44,104 @@ from pyflink.table.statement_set import StatementSet
 from pyflink.table.table_config import TableConfig
 from pyflink.table.table_descriptor import TableDescriptor
 from pyflink.table.table_result import TableResult
-from pyflink.table.types import _to_java_type, _create_type_verifier, RowType, DataType, \
-    _infer_schema_from_data, _create_converter, from_arrow_type, RowField, create_arrow_schema, \
-    _to_java_data_type
+from pyflink.table.types import _to_java_type, _get_type_verifier, RowType, DataType, \
+    _infer_schema_from_data, _get_converter, from_arrow_type, RowField, _get_arrow_schema, \
+    _to_java_data_type, LocalZonedTimestampType
 from pyflink.table.udf import UserDefinedFunctionWrapper, AggregateFunction, udaf, \
     udtaf, TableAggregateFunction
-from pyflink.table.utils import to_expression_jarray
-from pyflink.util import java_utils
+from pyflink.table.utils import to_expression_jarray, pandas_to_arrow, rows_to_arrow
 from pyflink.util.java_utils import get_j_env_configuration, is_local_deployment, load_java_class, \
-    to_j_explain_detail_arr, to_jarray
+    to_j_explain_detail_arr, get_jvm_attr, from_j_string_array, to_j_string_array
 
 __all__ = [
     'StreamTableEnvironment',
     'TableEnvironment'
 ]
 
+# Arrow data up to this size is passed to the JVM directly instead of via a temporary file. Larger
+# data is faster to transfer via a file than as a Py4J byte array.
+_MAX_ARROW_BYTES_TRANSFERRED_IN_MEMORY = 64 * 1024
+
+# Pickled elements up to this size are passed to the JVM directly instead of via a temporary file,
+# for the same reason as the Arrow data above.
+_MAX_PICKLED_BYTES_TRANSFERRED_IN_MEMORY = 64 * 1024
+
+# The tmpfs mount used to hand over larger Arrow data to the JVM without going through the disk.
+_SHARED_MEMORY_DIR = '/dev/shm'
+
+# The buffer size of the temporary files used to hand over data to the JVM, which saves write
+# calls for the many small writes of the serializers.
+_TEMP_FILE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# the error of from_elements when only some of the elements are expressions
+_PARTIAL_EXPRESSION_ELEMENTS = "It doesn't support part of the elements are Expression, while " \
+                               "the others are not."
+
+# the messages of the deprecation warnings of the deprecated methods
+_DEPRECATED_FROM_TABLE_SOURCE = "Deprecated in 1.11."
+_DEPRECATED_REGISTER_TABLE = "Deprecated in 1.10. Use create_temporary_view instead."
+_DEPRECATED_REGISTER_TABLE_SOURCE_OR_SINK = "Deprecated in 1.10. Use create_table instead."
+_DEPRECATED_SCAN = "Deprecated in 1.10. Use from_path instead."
+_DEPRECATED_INSERT_INTO = "Deprecated in 1.11. Use Table#execute_insert for single sink," \
+    "use create_statement_set for multiple sinks."
+_DEPRECATED_EXPLAIN = "Deprecated in 1.11. Use Table#explain instead."
+_DEPRECATED_SQL_UPDATE = "Deprecated in 1.11. Use execute_sql for single statement, " \
+    "use create_statement_set for multiple DML statements."
+_DEPRECATED_REGISTER_JAVA_FUNCTION = \
+    "Deprecated in 1.12. Use :func:`create_java_temporary_system_function` instead."
+_DEPRECATED_REGISTER_FUNCTION = \
+    "Deprecated in 1.12. Use :func:`create_temporary_system_function` instead."
+_DEPRECATED_EXECUTE = "Deprecated in 1.11. Use execute_sql for single sink, " \
+    "use create_statement_set for multiple sinks."
+
+
+def _get_option_key(option: str) -> str:
+    """
+    Returns the key of the given ConfigOption, e.g. "python.files" for
+    "PythonOptions.PYTHON_FILES".
+    """
+    return _get_option_key_of_gateway(get_gateway(), option)
+
+
+@lru_cache(maxsize=32)
+def _get_option_key_of_gateway(gateway, option: str) -> str:
+    return get_jvm_attr(option).key()
+
+
+def _get_arrow_temp_dir(size_hint: int) -> str:
+    """
+    Returns the directory of the temporary file used to hand over Arrow data of about the given
+    size to the JVM. It's the shared memory if there is enough room for the data, as both processes
+    run on the same host.
+    """
+    if os.access(_SHARED_MEMORY_DIR, os.W_OK):
+        stat = os.statvfs(_SHARED_MEMORY_DIR)
+        if stat.f_bavail * stat.f_frsize > 2 * size_hint:
+            return _SHARED_MEMORY_DIR
+    return tempfile.gettempdir()
+
+
+def _write_arrow_temp_file(size_hint: int, write_func) -> str:
+    """
+    Writes Arrow data of about the given size to a new temporary file with the given function,
+    which is called with the name of the file, and returns the name of the file. If writing to the
+    shared memory fails, e.g. because it has been filled up in the meantime, the file is written
+    to the regular temporary directory instead.
+    """
+    temp_dirs = [_get_arrow_temp_dir(size_hint)]
+    if temp_dirs[0] != tempfile.gettempdir():
+        temp_dirs.append(tempfile.gettempdir())
+    for i, temp_dir in enumerate(temp_dirs):
+        fd, file_name = tempfile.mkstemp(dir=temp_dir)
+        os.close(fd)
+        try:
+            write_func(file_name)
+            return file_name
+        except BaseException as e:
+            os.unlink(file_name)
+            if not isinstance(e, OSError) or i == len(temp_dirs) - 1:
+                raise
+
 
 class TableEnvironment(object):
     """
@@ -91,6 +178,17 @@ class TableEnvironment(object):
     def __init__(self, j_tenv, serializer=PickleSerializer()):
         self._j_tenv = j_tenv
         self._serializer = serializer
+        # 'from' is a python keyword, so the Java method has to be looked up via get_method
+        self._j_from = get_method(j_tenv, "from")
+        # the catalogs which have been looked up via get_catalog, keyed by the catalog name
+        self._catalog_cache = {}
+        # created lazily in get_config and _get_j_configuration respectively
+        self.table_config = None
+        self._j_configuration = None
+        # the values of pipeline.jars and pipeline.classpaths of the table config at the last sync,
+        # paired with the value of the execution environment configuration right after it,
+        # keyed by the config key
+        self._synced_jar_urls = {}
         # When running in MiniCluster, launch the Python UDF worker using the Python executable
         # specified by sys.executable if users have not specified it explicitly via configuration
         # python.executable.
@@ -125,7 +223,7 @@ class TableEnvironment(object):
         :param table_source: The table source used as table.
         :return: The result table.
         """
-        warnings.warn("Deprecated in 1.11.", DeprecationWarning)
+        _warn(_DEPRECATED_FROM_TABLE_SOURCE, DeprecationWarning, stacklevel=2)
         return Table(self._j_tenv.fromTableSource(table_source._j_table_source), self)
 
     def register_catalog(self, catalog_name: str, catalog: Catalog):
@@ -136,6 +234,7 @@ class TableEnvironment(object):
         :param catalog_name: The name under which the catalog will be registered.
         :param catalog: The catalog to register.
         """
+        self._catalog_cache.pop(catalog_name, None)
         self._j_tenv.registerCatalog(catalog_name, catalog._j_catalog)
 
     def get_catalog(self, catalog_name: str) -> Catalog:
@@ -146,11 +245,14 @@ class TableEnvironment(object):
         :return: The requested catalog, None if there is no
                  registered catalog with given name.
         """
-        catalog = self._j_tenv.getCatalog(catalog_name)
-        if catalog.isPresent():
-            return Catalog(catalog.get())
-        else:
-            return None
+        catalog = self._catalog_cache.get(catalog_name)
+        if catalog is None:
+            j_catalog = self._j_tenv.getCatalog(catalog_name)
+            if not j_catalog.isPresent():
+                return None
+            catalog = Catalog(j_catalog.get())
+            self._catalog_cache[catalog_name] = catalog
+        return catalog
 
     def load_module(self, module_name: str, module: Module):
         """
@@ -185,7 +287,7 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.13.0
         """
-        j_module_names = to_jarray(get_gateway().jvm.String, module_names)
+        j_module_names = to_j_string_array(module_names)
         self._j_tenv.useModules(j_module_names)
 
     def create_java_temporary_system_function(self, name: str, function_class_name: str):
@@ -215,9 +317,7 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.12.0
         """
-        gateway = get_gateway()
-        java_function = gateway.jvm.Thread.currentThread().getContextClassLoader() \
-            .loadClass(function_class_name)
+        java_function = load_java_class(function_class_name)
         self._j_tenv.createTemporarySystemFunction(name, java_function)
 
     def create_temporary_system_function(self, name: str,
@@ -303,9 +403,7 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.12.0
         """
-        gateway = get_gateway()
-        java_function = gateway.jvm.Thread.currentThread().getContextClassLoader() \
-            .loadClass(function_class_name)
+        java_function = load_java_class(function_class_name)
         if ignore_if_exists is None:
             self._j_tenv.createFunction(path, java_function)
         else:
@@ -352,9 +450,7 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.12.0
         """
-        gateway = get_gateway()
-        java_function = gateway.jvm.Thread.currentThread().getContextClassLoader() \
-            .loadClass(function_class_name)
+        java_function = load_java_class(function_class_name)
         self._j_tenv.createTemporaryFunction(path, java_function)
 
     def create_temporary_function(self, path: str, function: Union[UserDefinedFunctionWrapper,
@@ -487,7 +583,7 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.10. Use :func:`create_temporary_view` instead.
         """
-        warnings.warn("Deprecated in 1.10. Use create_temporary_view instead.", DeprecationWarning)
+        _warn(_DEPRECATED_REGISTER_TABLE, DeprecationWarning, stacklevel=2)
         self._j_tenv.registerTable(name, table._j_table)
 
     def register_table_source(self, name: str, table_source: TableSource):
@@ -510,7 +606,7 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.10. Use :func:`execute_sql` instead.
         """
-        warnings.warn("Deprecated in 1.10. Use create_table instead.", DeprecationWarning)
+        _warn(_DEPRECATED_REGISTER_TABLE_SOURCE_OR_SINK, DeprecationWarning, stacklevel=2)
         self._j_tenv.registerTableSourceInternal(name, table_source._j_table_source)
 
     def register_table_sink(self, name: str, table_sink: TableSink):
@@ -533,7 +629,7 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.10. Use :func:`execute_sql` instead.
         """
-        warnings.warn("Deprecated in 1.10. Use create_table instead.", DeprecationWarning)
+        _warn(_DEPRECATED_REGISTER_TABLE_SOURCE_OR_SINK, DeprecationWarning, stacklevel=2)
         self._j_tenv.registerTableSinkInternal(name, table_sink._j_table_sink)
 
     def scan(self, *table_path: str) -> Table:
@@ -563,11 +659,10 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.10. Use :func:`from_path` instead.
         """
-        warnings.warn("Deprecated in 1.10. Use from_path instead.", DeprecationWarning)
-        gateway = get_gateway()
-        j_table_paths = java_utils.to_jarray(gateway.jvm.String, table_path)
-        j_table = self._j_tenv.scan(j_table_paths)
-        return Table(j_table, self)
+        _warn(_DEPRECATED_SCAN, DeprecationWarning, stacklevel=2)
+        # delegates to from_path with escaped identifiers instead of filling a Java String[]
+        # element by element
+        return self.from_path(".".join("`%s`" % p.replace("`", "``") for p in table_path))
 
     def from_path(self, path: str) -> Table:
         """
@@ -603,7 +698,7 @@ class TableEnvironment(object):
         .. seealso:: :func:`use_database`
         .. versionadded:: 1.10.0
         """
-        return Table(get_method(self._j_tenv, "from")(path), self)
+        return Table(self._j_from(path), self)
 
     def from_descriptor(self, descriptor: TableDescriptor) -> Table:
         """
@@ -630,7 +725,7 @@ class TableEnvironment(object):
 
         :return: The Table object describing the pipeline for further transformations.
         """
-        return Table(get_method(self._j_tenv, "from")(descriptor._j_table_descriptor), self)
+        return Table(self._j_from(descriptor._j_table_descriptor), self)
 
     def insert_into(self, target_path: str, table: Table):
         """
@@ -656,8 +751,7 @@ class TableEnvironment(object):
         .. note:: Deprecated in 1.11. Use :func:`execute_insert` for single sink,
                   use :func:`create_statement_set` for multiple sinks.
         """
-        warnings.warn("Deprecated in 1.11. Use Table#execute_insert for single sink,"
-                      "use create_statement_set for multiple sinks.", DeprecationWarning)
+        _warn(_DEPRECATED_INSERT_INTO, DeprecationWarning, stacklevel=2)
         self._j_tenv.insertInto(target_path, table._j_table)
 
     def list_catalogs(self) -> List[str]:
@@ -667,7 +761,7 @@ class TableEnvironment(object):
         :return: List of catalog names.
         """
         j_catalog_name_array = self._j_tenv.listCatalogs()
-        return [item for item in j_catalog_name_array]
+        return from_j_string_array(j_catalog_name_array)
 
     def list_modules(self) -> List[str]:
         """
@@ -678,7 +772,7 @@ class TableEnvironment(object):
         .. versionadded:: 1.10.0
         """
         j_module_name_array = self._j_tenv.listModules()
-        return [item for item in j_module_name_array]
+        return from_j_string_array(j_module_name_array)
 
     def list_full_modules(self) -> List[ModuleEntry]:
         """
@@ -689,7 +783,9 @@ class TableEnvironment(object):
         .. versionadded:: 1.13.0
         """
         j_module_entry_array = self._j_tenv.listFullModules()
-        return [ModuleEntry(entry.name(), entry.used()) for entry in j_module_entry_array]
+        module_entries = pickle.loads(
+            get_jvm_attr("PythonBridgeUtils").pickleModuleEntries(j_module_entry_array))
+        return [ModuleEntry(name, used) for name, used in module_entries]
 
     def list_databases(self) -> List[str]:
         """
@@ -698,7 +794,7 @@ class TableEnvironment(object):
         :return: List of database names in the current catalog.
         """
         j_database_name_array = self._j_tenv.listDatabases()
-        return [item for item in j_database_name_array]
+        return from_j_string_array(j_database_name_array)
 
     def list_tables(self) -> List[str]:
         """
@@ -708,7 +804,7 @@ class TableEnvironment(object):
         :return: List of table and view names in the current database of the current catalog.
         """
         j_table_name_array = self._j_tenv.listTables()
-        return [item for item in j_table_name_array]
+        return from_j_string_array(j_table_name_array)
 
     def list_views(self) -> List[str]:
         """
@@ -720,7 +816,7 @@ class TableEnvironment(object):
         .. versionadded:: 1.11.0
         """
         j_view_name_array = self._j_tenv.listViews()
-        return [item for item in j_view_name_array]
+        return from_j_string_array(j_view_name_array)
 
     def list_user_defined_functions(self) -> List[str]:
         """
@@ -729,7 +825,7 @@ class TableEnvironment(object):
         :return: List of the names of all user defined functions registered in this environment.
         """
         j_udf_name_array = self._j_tenv.listUserDefinedFunctions()
-        return [item for item in j_udf_name_array]
+        return from_j_string_array(j_udf_name_array)
 
     def list_functions(self) -> List[str]:
         """
@@ -740,7 +836,7 @@ class TableEnvironment(object):
         .. versionadded:: 1.10.0
         """
         j_function_name_array = self._j_tenv.listFunctions()
-        return [item for item in j_function_name_array]
+        return from_j_string_array(j_function_name_array)
 
     def list_temporary_tables(self) -> List[str]:
         """
@@ -754,7 +850,7 @@ class TableEnvironment(object):
         .. versionadded:: 1.10.0
         """
         j_table_name_array = self._j_tenv.listTemporaryTables()
-        return [item for item in j_table_name_array]
+        return from_j_string_array(j_table_name_array)
 
     def list_temporary_views(self) -> List[str]:
         """
@@ -768,7 +864,7 @@ class TableEnvironment(object):
         .. versionadded:: 1.10.0
         """
         j_view_name_array = self._j_tenv.listTemporaryViews()
-        return [item for item in j_view_name_array]
+        return from_j_string_array(j_view_name_array)
 
     def drop_temporary_table(self, table_path: str) -> bool:
         """
@@ -810,7 +906,7 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.11. Use :class:`Table`#:func:`explain` instead.
         """
-        warnings.warn("Deprecated in 1.11. Use Table#explain instead.", DeprecationWarning)
+        _warn(_DEPRECATED_EXPLAIN, DeprecationWarning, stacklevel=2)
         if table is None:
             return self._j_tenv.explain(extended)
         else:
@@ -869,6 +965,8 @@ class TableEnvironment(object):
         .. versionadded:: 1.11.0
         """
         self._before_execute()
+        # the statement may create or drop catalogs
+        self._catalog_cache.clear()
         return TableResult(self._j_tenv.executeSql(stmt))
 
     def create_statement_set(self) -> StatementSet:
@@ -957,8 +1055,8 @@ class TableEnvironment(object):
         .. note:: Deprecated in 1.11. Use :func:`execute_sql` for single statement,
                   use :func:`create_statement_set` for multiple DML statements.
         """
-        warnings.warn("Deprecated in 1.11. Use execute_sql for single statement, "
-                      "use create_statement_set for multiple DML statements.", DeprecationWarning)
+        _warn(_DEPRECATED_SQL_UPDATE, DeprecationWarning, stacklevel=2)
+        self._catalog_cache.clear()
         self._j_tenv.sqlUpdate(stmt)
 
     def get_current_catalog(self) -> str:
@@ -1085,11 +1183,9 @@ class TableEnvironment(object):
 
         :return: Current table config.
         """
-        if not hasattr(self, "table_config"):
-            table_config = TableConfig()
-            table_config._j_table_config = self._j_tenv.getConfig()
-            setattr(self, "table_config", table_config)
-        return getattr(self, "table_config")
+        if self.table_config is None:
+            self.table_config = TableConfig(self._j_tenv.getConfig())
+        return self.table_config
 
     def register_java_function(self, name: str, function_class_name: str):
         """
@@ -1109,20 +1205,12 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.12. Use :func:`create_java_temporary_system_function` instead.
         """
-        warnings.warn("Deprecated in 1.12. Use :func:`create_java_temporary_system_function` "
-                      "instead.", DeprecationWarning)
-        gateway = get_gateway()
-        java_function = gateway.jvm.Thread.currentThread().getContextClassLoader()\
-            .loadClass(function_class_name).newInstance()
+        _warn(_DEPRECATED_REGISTER_JAVA_FUNCTION, DeprecationWarning, stacklevel=2)
+        java_function = load_java_class(function_class_name).newInstance()
         # this is a temporary solution and will be unified later when we use the new type
         # system(DataType) to replace the old type system(TypeInformation).
         if not isinstance(self, StreamTableEnvironment) or self.__class__ == TableEnvironment:
-            if self._is_table_function(java_function):
-                self._register_table_function(name, java_function)
-            elif self._is_aggregate_function(java_function):
-                self._register_aggregate_function(name, java_function)
-            else:
-                self._j_tenv.registerFunction(name, java_function)
+            self._register_legacy_function(name, java_function)
         else:
             self._j_tenv.registerFunction(name, java_function)
 
@@ -1155,19 +1243,13 @@ class TableEnvironment(object):
 
         .. note:: Deprecated in 1.12. Use :func:`create_temporary_system_function` instead.
         """
-        warnings.warn("Deprecated in 1.12. Use :func:`create_temporary_system_function` "
-                      "instead.", DeprecationWarning)
+        _warn(_DEPRECATED_REGISTER_FUNCTION, DeprecationWarning, stacklevel=2)
         function = self._wrap_aggregate_function_if_needed(function)
         java_function = function._java_user_defined_function()
         # this is a temporary solution and will be unified later when we use the new type
         # system(DataType) to replace the old type system(TypeInformation).
         if self.__class__ == TableEnvironment:
-            if self._is_table_function(java_function):
-                self._register_table_function(name, java_function)
-            elif self._is_aggregate_function(java_function):
-                self._register_aggregate_function(name, java_function)
-            else:
-                self._j_tenv.registerFunction(name, java_function)
+            self._register_legacy_function(name, java_function)
         else:
             self._j_tenv.registerFunction(name, java_function)
 
@@ -1199,15 +1281,9 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.10.0
         """
-        jvm = get_gateway().jvm
-        python_files = self.get_config().get_configuration().get_string(
-            jvm.PythonOptions.PYTHON_FILES.key(), None)
-        if python_files is not None:
-            python_files = jvm.PythonDependencyUtils.FILE_DELIMITER.join([file_path, python_files])
-        else:
-            python_files = file_path
-        self.get_config().get_configuration().set_string(
-            jvm.PythonOptions.PYTHON_FILES.key(), python_files)
+        get_jvm_attr("PythonDependencyUtils").addToFileList(
+            self._get_j_configuration(),
+            _get_option_key("PythonOptions.PYTHON_FILES"), file_path, True)
 
     def set_python_requirements(self,
                                 requirements_file_path: str,
@@ -1245,13 +1321,12 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.10.0
         """
-        jvm = get_gateway().jvm
         python_requirements = requirements_file_path
         if requirements_cache_dir is not None:
-            python_requirements = jvm.PythonDependencyUtils.PARAM_DELIMITER.join(
+            python_requirements = get_jvm_attr("PythonDependencyUtils.PARAM_DELIMITER").join(
                 [python_requirements, requirements_cache_dir])
-        self.get_config().get_configuration().set_string(
-            jvm.PythonOptions.PYTHON_REQUIREMENTS.key(), python_requirements)
+        self._get_j_configuration().setString(
+            _get_option_key("PythonOptions.PYTHON_REQUIREMENTS"), python_requirements)
 
     def add_python_archive(self, archive_path: str, target_dir: str = None):
         """
@@ -1304,19 +1379,12 @@ class TableEnvironment(object):
 
         .. versionadded:: 1.10.0
         """
-        jvm = get_gateway().jvm
         if target_dir is not None:
-            archive_path = jvm.PythonDependencyUtils.PARAM_DELIMITER.join(
+            archive_path = get_jvm_attr("PythonDependencyUtils.PARAM_DELIMITER").join(
                 [archive_path, target_dir])
-        python_archives = self.get_config().get_configuration().get_string(
-            jvm.PythonOptions.PYTHON_ARCHIVES.key(), None)
-        if python_archives is not None:
-            python_files = jvm.PythonDependencyUtils.FILE_DELIMITER.join(
-                [python_archives, archive_path])
-        else:
-            python_files = archive_path
-        self.get_config().get_configuration().set_string(
-            jvm.PythonOptions.PYTHON_ARCHIVES.key(), python_files)
+        get_jvm_attr("PythonDependencyUtils").addToFileList(
+            self._get_j_configuration(),
+            _get_option_key("PythonOptions.PYTHON_ARCHIVES"), archive_path, False)
 
     def execute(self, job_name: str) -> JobExecutionResult:
         """
@@ -1341,8 +1409,7 @@ class TableEnvironment(object):
         .. note:: Deprecated in 1.11. Use :func:`execute_sql` for single sink,
                   use :func:`create_statement_set` for multiple sinks.
         """
-        warnings.warn("Deprecated in 1.11. Use execute_sql for single sink, "
-                      "use create_statement_set for multiple sinks.", DeprecationWarning)
+        _warn(_DEPRECATED_EXECUTE, DeprecationWarning, stacklevel=2)
         self._before_execute()
         return JobExecutionResult(self._j_tenv.execute(job_name))
 
@@ -1367,6 +1434,12 @@ class TableEnvironment(object):
 
         **list**, **tuple**, **dict**, **array**, :class:`~pyflink.table.Row`
 
+        The elements could also be a **pyarrow.Table** or a **pyarrow.RecordBatch**, which will be
+        transferred as is in Arrow format. In this case, the schema could be specified in the
+        same way as :func:`from_pandas`. A **pandas.DataFrame** is handled by :func:`from_pandas`
+        and a one or two dimensional numeric **numpy.ndarray** is converted column by column
+        into Arrow format, in which case the generated field names are "_1", "_2", etc.
+
         If the element type is a composite type, it will be unboxed.
         e.g. table_env.from_elements([(1, 'Hi'), (2, 'Hello')]) will return a table like:
 
@@ -1406,31 +1479,45 @@ class TableEnvironment(object):
         :return: The result table.
         """
 
+        # the elements could only be Arrow data if pyarrow has already been imported
+        pa = sys.modules.get("pyarrow")
+        if pa is not None and isinstance(elements, (pa.Table, pa.RecordBatch)):
+            return self._from_arrow_table(elements, schema)
+
+        # numpy and pandas data is converted in bulk instead of being inferred row by row
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(elements, pd.DataFrame):
+            return self.from_pandas(elements, schema)
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(elements, np.ndarray) and elements.ndim in (1, 2) \
+                and (elements.dtype.kind in "bif"
+                     or (elements.dtype.kind == "u" and elements.dtype.itemsize < 8)):
+            if elements.dtype.kind == "u":
+                # there are no unsigned types in Flink, so widens them to the next signed type
+                elements = elements.astype("i%d" % (elements.dtype.itemsize * 2))
+            import pyarrow as pa
+            columns = [elements] if elements.ndim == 1 else list(elements.T)
+            return self._from_arrow_table(
+                pa.Table.from_arrays(
+                    columns, names=["_%d" % (i + 1) for i in range(len(columns))]),
+                schema)
+
         # verifies the elements against the specified schema
+        verify_func = None
         if isinstance(schema, RowType):
-            verify_func = _create_type_verifier(schema) if verify_schema else lambda _: True
-
-            def verify_obj(obj):
-                verify_func(obj)
-                return obj
+            if verify_schema:
+                verify_func = _get_type_verifier(schema)
         elif isinstance(schema, DataType):
             data_type = schema
             schema = RowType().add("value", schema)
 
-            verify_func = _create_type_verifier(
-                data_type, name="field value") if verify_schema else lambda _: True
-
-            def verify_obj(obj):
-                verify_func(obj)
-                return obj
-        else:
-            def verify_obj(obj):
-                return obj
+            if verify_schema:
+                verify_func = _get_type_verifier(data_type, name="field value")
 
         # infers the schema if not specified
         if schema is None or isinstance(schema, (list, tuple)):
             schema = _infer_schema_from_data(elements, names=schema)
-            converter = _create_converter(schema)
+            converter = _get_converter(schema)
             elements = map(converter, elements)
 
         elif not isinstance(schema, RowType):
@@ -1440,21 +1527,36 @@ class TableEnvironment(object):
         elements = list(elements)
 
         # in case all the elements are expressions
-        if len(elements) > 0 and all(isinstance(elem, Expression) for elem in elements):
+        if len(elements) > 0 and isinstance(elements[0], Expression):
+            if not all(isinstance(elem, Expression) for elem in elements):
+                raise ValueError(_PARTIAL_EXPRESSION_ELEMENTS)
             if schema is None:
                 return Table(self._j_tenv.fromValues(to_expression_jarray(elements)), self)
             else:
                 return Table(self._j_tenv.fromValues(_to_java_data_type(schema),
                                                      to_expression_jarray(elements)),
                              self)
-        elif any(isinstance(elem, Expression) for elem in elements):
-            raise ValueError("It doesn't support part of the elements are Expression, while the "
-                             "others are not.")
 
-        # verifies the elements against the specified schema
-        elements = map(verify_obj, elements)
-        # converts python data to sql data
-        elements = [schema.to_sql_type(element) for element in elements]
+        # verifies the elements against the specified schema and checks whether they are all
+        # plain tuples in the same pass
+        plain_tuples = True
+        for element in elements:
+            if type(element) not in (tuple, list):
+                if isinstance(element, Expression):
+                    raise ValueError(_PARTIAL_EXPRESSION_ELEMENTS)
+                plain_tuples = False
+            if verify_func is not None:
+                verify_func(element)
+        # converts python data to sql data. Plain tuples don't need to be normalized row by row
+        # unless they fall back to pickle, as Arrow converts the python data of the types it
+        # supports column by column itself
+        if not plain_tuples:
+            elements = [schema.to_sql_type(element) for element in elements]
+        batch = rows_to_arrow(schema, elements)
+        if batch is not None:
+            return self._from_arrow_batches(schema, [batch])
+        if plain_tuples:
+            elements = [schema.to_sql_type(element) for element in elements]
         return self._from_elements(elements, schema)
 
     def _from_elements(self, elements: List, schema: Union[DataType, List[str]]) -> Table:
@@ -1464,29 +1566,98 @@ class TableEnvironment(object):
         :param elements: The elements to create a table from.
         :return: The result :class:`~pyflink.table.Table`.
         """
-        # serializes to a file, and we read the file in java
-        temp_file = tempfile.NamedTemporaryFile(delete=False, dir=tempfile.mkdtemp())
         serializer = BatchedSerializer(self._serializer)
+        buffer = io.BytesIO()
+        serializer.serialize(elements, buffer)
+        if buffer.tell() <= _MAX_PICKLED_BYTES_TRANSFERRED_IN_MEMORY:
+            # small data is passed to java directly, which saves the temporary file
+            return self._from_pickled_elements(schema, buffer.getvalue())
+
+        # writes the serialized data to a file, and we read the file in java
+        temp_file = tempfile.NamedTemporaryFile(
+            delete=False, dir=tempfile.mkdtemp(), buffering=_TEMP_FILE_BUFFER_SIZE)
         try:
             with temp_file:
-                serializer.serialize(elements, temp_file)
-            row_type_info = _to_java_type(schema)
-            execution_config = self._get_j_env().getConfig()
-            gateway = get_gateway()
-            j_objs = gateway.jvm.PythonBridgeUtils.readPythonObjects(temp_file.name, True)
-            PythonTableUtils = gateway.jvm \
-                .org.apache.flink.table.planner.utils.python.PythonTableUtils
-            PythonInputFormatTableSource = gateway.jvm \
-                .org.apache.flink.table.planner.utils.python.PythonInputFormatTableSource
-            j_input_format = PythonTableUtils.getInputFormat(
-                j_objs, row_type_info, execution_config)
-            j_table_source = PythonInputFormatTableSource(
-                j_input_format, row_type_info)
-
-            return Table(self._j_tenv.fromTableSource(j_table_source), self)
+                temp_file.write(buffer.getbuffer())
+            del buffer
+            return self._from_pickled_elements(schema, temp_file.name)
         finally:
             os.unlink(temp_file.name)
 
+    def _from_pickled_elements(self, schema: RowType, pickled_source: Union[str, bytes]) -> Table:
+        """
+        Creates a table from pickled elements which are either stored in the file of the given
+        name or given as the serialized data itself.
+        """
+        row_type_info = _to_java_type(schema)
+        execution_config = self._get_j_env().getConfig()
+        j_objs = get_jvm_attr("PythonBridgeUtils").readPythonObjects(pickled_source, True)
+        PythonTableUtils = get_jvm_attr(
+            "org.apache.flink.table.planner.utils.python.PythonTableUtils")
+        PythonInputFormatTableSource = get_jvm_attr(
+            "org.apache.flink.table.planner.utils.python.PythonInputFormatTableSource")
+        j_input_format = PythonTableUtils.getInputFormat(
+            j_objs, row_type_info, execution_config)
+        j_table_source = PythonInputFormatTableSource(
+            j_input_format, row_type_info)
+
+        return Table(self._j_tenv.fromTableSource(j_table_source), self)
+
+    def _from_arrow_batches(self, result_type: RowType, batches) -> Table:
+        """
+        Creates a table from Arrow record batches whose schema matches the given row type.
+
+        :param result_type: The row type of the result table.
+        :param batches: The Arrow record batches.
+        :return: The result :class:`~pyflink.table.Table`.
+        """
+        import pyarrow as pa
+        size = sum(batch.nbytes for batch in batches)
+        if size <= _MAX_ARROW_BYTES_TRANSFERRED_IN_MEMORY:
+            # small data is passed to java directly, which saves the temporary file
+            sink = pa.BufferOutputStream()
+            self._write_arrow_batches(sink, batches)
+            return self._from_arrow_source(result_type, sink.getvalue().to_pybytes())
+
+        # serializes to a file, and we read the file in java
+        def write_batches(file_name):
+            # Arrow writes the buffers of the batches to the file itself instead of copying them
+            # into python bytes for a python file object
+            with pa.OSFile(file_name, 'wb') as sink:
+                self._write_arrow_batches(sink, batches)
+
+        file_name = _write_arrow_temp_file(size, write_batches)
+        try:
+            return self._from_arrow_source(result_type, file_name)
+        finally:
+            os.unlink(file_name)
+
+    @staticmethod
+    def _write_arrow_batches(sink, batches):
+        import pyarrow as pa
+        writer = None
+        for batch in batches:
+            if writer is None:
+                writer = pa.RecordBatchStreamWriter(sink, batch.schema)
+            writer.write_batch(batch)
+        if writer is not None:
+            writer.close()
+
+    def _from_arrow_source(self, result_type: RowType, arrow_source: Union[str, bytes]) -> Table:
+        """
+        Creates a table from Arrow data which is either the name of a file containing the
+        serialized Arrow stream or the serialized Arrow stream itself.
+        """
+        data_type = get_jvm_attr("org.apache.flink.table.types.utils.TypeConversions") \
+            .fromLegacyInfoToDataType(_to_java_type(result_type)).notNull()
+        data_type = data_type.bridgedTo(
+            load_java_class('org.apache.flink.table.data.RowData'))
+
+        j_arrow_table_source = \
+            get_jvm_attr("org.apache.flink.table.runtime.arrow.ArrowUtils") \
+            .createArrowTableSource(data_type, arrow_source)
+        return Table(self._j_tenv.fromTableSource(j_arrow_table_source), self)
+
     def from_pandas(self, pdf,
                     schema: Union[RowType, List[str], Tuple[str], List[DataType],
                                   Tuple[DataType]] = None,
@@ -1523,116 +1694,135 @@ class TableEnvironment(object):
 
         import pyarrow as pa
         arrow_schema = pa.Schema.from_pandas(pdf, preserve_index=False)
+        result_type = self._get_result_type_of_arrow_schema(arrow_schema, schema)
+        # splits the rows as evenly as possible into exactly splits_num slices, but doesn't create
+        # empty slices unless the DataFrame is empty
+        splits_num = max(1, min(splits_num, len(pdf)))
+        bounds = [len(pdf) * i // splits_num for i in range(splits_num + 1)]
+
+        if not any(isinstance(field_type, LocalZonedTimestampType)
+                   for field_type in result_type.field_types()):
+            # converts the slices to Arrow directly from the blocks of the DataFrame, which avoids
+            # materializing each column as a Series. Timestamps with local time zone have to be
+            # converted to internal and so are handled by the serializer below.
+            arrow_schema = _get_arrow_schema(result_type)
+            # the columns beyond the fields of the schema are ignored
+            renamed_pdf = pdf.iloc[:, :len(result_type.field_names())].copy(deep=False)
+            renamed_pdf.columns = result_type.field_names()
+            pdf_slices = [renamed_pdf.iloc[start:end] for start, end in zip(bounds, bounds[1:])]
+
+            def to_arrow_batch(pdf_slice):
+                try:
+                    return pa.RecordBatch.from_pandas(
+                        pdf_slice, schema=arrow_schema, preserve_index=False)
+                except pa.ArrowException:
+                    # converts column by column to report which column fails to be converted
+                    return pandas_to_arrow(
+                        arrow_schema, None, result_type.field_types(),
+                        [c for (_, c) in pdf_slice.iteritems()])
+
+            if len(pdf_slices) > 1:
+                # the slices are independent and Arrow releases the GIL while converting them
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(
+                        max_workers=min(len(pdf_slices), os.cpu_count() or 1)) as executor:
+                    batches = list(executor.map(to_arrow_batch, pdf_slices))
+            else:
+                batches = [to_arrow_batch(pdf_slice) for pdf_slice in pdf_slices]
+            return self._from_arrow_batches(result_type, batches)
 
+        # serializes to a file, and we read the file in java
+        import pytz
+        serializer = ArrowSerializer(
+            _get_arrow_schema(result_type),
+            result_type,
+            pytz.timezone(self.get_config().get_local_timezone()))
+        pdf_slices = [pdf.iloc[start:end] for start, end in zip(bounds, bounds[1:])]
+        data = [[c for (_, c) in pdf_slice.iteritems()] for pdf_slice in pdf_slices]
+
+        def write_data(file_name):
+            with open(file_name, 'wb', buffering=_TEMP_FILE_BUFFER_SIZE) as temp_file:
+                serializer.serialize(data, temp_file)
+
+        # the deep memory usage includes the content of the objects, e.g. strings
+        file_name = _write_arrow_temp_file(
+            pdf.memory_usage(index=False, deep=True).sum(), write_data)
+        try:
+            return self._from_arrow_source(result_type, file_name)
+        finally:
+            os.unlink(file_name)
+
+    def _from_arrow_table(self, arrow_table, schema) -> Table:
+        import pyarrow as pa
+        if isinstance(arrow_table, pa.RecordBatch):
+            arrow_table = pa.Table.from_batches([arrow_table])
+        result_type = self._get_result_type_of_arrow_schema(arrow_table.schema, schema)
+        arrow_table = arrow_table.rename_columns(result_type.field_names()).cast(
+            _get_arrow_schema(result_type))
+        return self._from_arrow_batches(result_type, arrow_table.to_batches())
+
+    @staticmethod
+    def _get_result_type_of_arrow_schema(arrow_schema, schema) -> RowType:
         if schema is not None:
             if isinstance(schema, RowType):
-                result_type = schema
+                return schema
             elif isinstance(schema, (list, tuple)) and isinstance(schema[0], str):
-                result_type = RowType(
+                return RowType(
                     [RowField(field_name, from_arrow_type(field.type, field.nullable))
                      for field_name, field in zip(schema, arrow_schema)])
             elif isinstance(schema, (list, tuple)) and isinstance(schema[0], DataType):
-                result_type = RowType(
+                return RowType(
                     [RowField(field_name, field_type) for field_name, field_type in zip(
                         arrow_schema.names, schema)])
             else:
                 raise TypeError("Unsupported schema type, it could only be of RowType, a "
                                 "list of str or a list of DataType, got %s" % schema)
         else:
-            result_type = RowType([RowField(field.name, from_arrow_type(field.type, field.nullable))
-                                   for field in arrow_schema])
-
-        # serializes to a file, and we read the file in java
-        temp_file = tempfile.NamedTemporaryFile(delete=False, dir=tempfile.mkdtemp())
-        import pytz
-        serializer = ArrowSerializer(
-            create_arrow_schema(result_type.field_names(), result_type.field_types()),
-            result_type,
-            pytz.timezone(self.get_config().get_local_timezone()))
-        step = -(-len(pdf) // splits_num)
-        pdf_slices = [pdf.iloc[start:start + step] for start in range(0, len(pdf), step)]
-        data = [[c for (_, c) in pdf_slice.iteritems()] for pdf_slice in pdf_slices]
-        try:
-            with temp_file:
-                serializer.serialize(data, temp_file)
-            jvm = get_gateway().jvm
-
-            data_type = jvm.org.apache.flink.table.types.utils.TypeConversions\
-                .fromLegacyInfoToDataType(_to_java_type(result_type)).notNull()
-            data_type = data_type.bridgedTo(
-                load_java_class('org.apache.flink.table.data.RowData'))
-
-            j_arrow_table_source = \
-                jvm.org.apache.flink.table.runtime.arrow.ArrowUtils.createArrowTableSource(
-                    data_type, temp_file.name)
-            return Table(self._j_tenv.fromTableSource(j_arrow_table_source), self)
-        finally:
-            os.unlink(temp_file.name)
+            return RowType([RowField(field.name, from_arrow_type(field.type, field.nullable))
+                            for field in arrow_schema])
 
     def _set_python_executable_for_local_executor(self):
-        jvm = get_gateway().jvm
+        python_executable_key = _get_option_key("PythonOptions.PYTHON_EXECUTABLE")
         j_config = get_j_env_configuration(self._get_j_env())
-        if not j_config.containsKey(jvm.PythonOptions.PYTHON_EXECUTABLE.key()) \
-                and is_local_deployment(j_config):
-            j_config.setString(jvm.PythonOptions.PYTHON_EXECUTABLE.key(), sys.executable)
+        if not j_config.containsKey(python_executable_key) and is_local_deployment(j_config):
+            j_config.setString(python_executable_key, sys.executable)
 
     def _add_jars_to_j_env_config(self, config_key):
-        jvm = get_gateway().jvm
-        jar_urls = self.get_config().get_configuration().get_string(config_key, None)
-        if jar_urls is not None:
-            # normalize and remove duplicates
-            jar_urls_set = set([jvm.java.net.URL(url).toString() for url in jar_urls.split(";")])
-            j_configuration = get_j_env_configuration(self._get_j_env())
-            if j_configuration.containsKey(config_key):
-                for url in j_configuration.getString(config_key, "").split(";"):
-                    jar_urls_set.add(url)
-            j_configuration.setString(config_key, ";".join(jar_urls_set))
+        jar_urls = self._get_j_configuration().getString(config_key, None)
+        if jar_urls is None:
+            return
+        j_env_config = get_j_env_configuration(self._get_j_env())
+        # the jars are still there if neither the table config nor the execution environment
+        # config has changed since the last sync
+        if self._synced_jar_urls.get(config_key) == \
+                (jar_urls, j_env_config.getString(config_key, None)):
+            return
+        # normalizes and removes duplicates in java, which saves a round trip per url
+        get_jvm_attr("org.apache.flink.python.util.PythonConfigUtil").addJarUrls(
+            j_env_config, config_key, jar_urls)
+        self._synced_jar_urls[config_key] = (jar_urls, j_env_config.getString(config_key, None))
+
+    def _get_j_configuration(self):
+        """
+        Returns the Java Configuration of the table config. It's cached as the table config
+        always holds the same Configuration instance.
+        """
+        if self._j_configuration is None:
+            self._j_configuration = self.get_config()._j_table_config.getConfiguration()
+        return self._j_configuration
 
     def _get_j_env(self):
         return self._j_tenv.getPlanner().getExecEnv()
 
-    @staticmethod
-    def _is_table_function(java_function):
-        java_function_class = java_function.getClass()
-        j_table_function_class = get_java_class(
-            get_gateway().jvm.org.apache.flink.table.functions.TableFunction)
-        return j_table_function_class.isAssignableFrom(java_function_class)
-
-    @staticmethod
-    def _is_aggregate_function(java_function):
-        java_function_class = java_function.getClass()
-        j_aggregate_function_class = get_java_class(
-            get_gateway().jvm.org.apache.flink.table.functions.ImperativeAggregateFunction)
-        return j_aggregate_function_class.isAssignableFrom(java_function_class)
-
-    def _register_table_function(self, name, table_function):
-        function_catalog = self._get_function_catalog()
-        gateway = get_gateway()
-        helper = gateway.jvm.org.apache.flink.table.functions.UserDefinedFunctionHelper
-        result_type = helper.getReturnTypeOfTableFunction(table_function)
-        function_catalog.registerTempSystemTableFunction(name, table_function, result_type)
-
-    def _register_aggregate_function(self, name, aggregate_function):
-        function_catalog = self._get_function_catalog()
-        gateway = get_gateway()
-        helper = gateway.jvm.org.apache.flink.table.functions.UserDefinedFunctionHelper
-        result_type = helper.getReturnTypeOfAggregateFunction(aggregate_function)
-        acc_type = helper.getAccumulatorTypeOfAggregateFunction(aggregate_function)
-        function_catalog.registerTempSystemAggregateFunction(
-            name, aggregate_function, result_type, acc_type)
-
-    def _get_function_catalog(self):
-        function_catalog_field = self._j_tenv.getClass().getDeclaredField("functionCatalog")
-        function_catalog_field.setAccessible(True)
-        function_catalog = function_catalog_field.get(self._j_tenv)
-        return function_catalog
+    def _register_legacy_function(self, name, java_function):
+        get_jvm_attr("org.apache.flink.table.planner.utils.python.PythonTableUtils") \
+            .registerLegacyFunction(self._j_tenv, name, java_function)
 
     def _before_execute(self):
-        jvm = get_gateway().jvm
-        jars_key = jvm.org.apache.flink.configuration.PipelineOptions.JARS.key()
-        classpaths_key = jvm.org.apache.flink.configuration.PipelineOptions.CLASSPATHS.key()
-        self._add_jars_to_j_env_config(jars_key)
-        self._add_jars_to_j_env_config(classpaths_key)
+        self._add_jars_to_j_env_config(
+            _get_option_key("org.apache.flink.configuration.PipelineOptions.JARS"))
+        self._add_jars_to_j_env_config(
+            _get_option_key("org.apache.flink.configuration.PipelineOptions.CLASSPATHS"))
 
     def _wrap_aggregate_function_if_needed(self, function) -> UserDefinedFunctionWrapper:
         if isinstance(function, AggregateFunction):
@@ -1751,7 +1941,7 @@ class StreamTableEnvironment(TableEnvironment):
         .. versionadded:: 1.12.0
         """
         j_data_stream = data_stream._j_data_stream
-        JPythonConfigUtil = get_gateway().jvm.org.apache.flink.python.util.PythonConfigUtil
+        JPythonConfigUtil = get_jvm_attr("org.apache.flink.python.util.PythonConfigUtil")
         JPythonConfigUtil.configPythonOperator(j_data_stream.getExecutionEnvironment())
         if len(fields) == 0:
             return Table(j_table=self._j_tenv.fromDataStream(j_data_stream), t_env=self)
@@ -19,7 +19,7 @@ from typing import List, Optional, Union
 
 from pyflink.java_gateway import get_gateway
 from pyflink.table.types import _to_java_type, _from_java_type, DataType, RowType
-from pyflink.util.java_utils import to_jarray
+from pyflink.util.java_utils import to_jarray, from_j_string_array
 
 __all__ = ['TableSchema']
 
@@ -85,7 +85,7 @@ class TableSchema(object):
 
         :return: The list of all field names.
         """
-        return list(self._j_table_schema.getFieldNames())
+        return from_j_string_array(self._j_table_schema.getFieldNames())
 
     def get_field_name(self, field_index: int) -> Optional[str]:
         """
@@ -96,6 +96,22 @@ class PandasConversionTests(PandasConversionTestBase):
         with self.assertRaisesRegex(Exception, "Expected a string.*got int8"):
             self.t_env.from_pandas(self.pdf, schema=wrong_schema)
 
+    def test_from_pandas_with_unconvertible_column(self):
+        import pandas as pd
+        pdf = pd.DataFrame({'a': pd.Series(['x', 'y'], dtype=object)})
+        with self.assertRaisesRegex(
+                RuntimeError, r"converting pandas.Series \(object\) to pyarrow.Array \(int64\)"):
+            self.t_env.from_pandas(pdf, schema=DataTypes.ROW(
+                [DataTypes.FIELD("a", DataTypes.BIGINT())]))
+
+    def test_from_pandas_with_fewer_fields_than_columns(self):
+        # the columns beyond the fields of the schema are ignored
+        schema = DataTypes.ROW(self.data_type.fields[:3], False)
+        table = self.t_env.from_pandas(self.pdf, schema=schema)
+        self.assertEqual(schema, table.get_schema().to_row_data_type())
+        with table.execute().collect() as result:
+            self.assertEqual([Row(1, 1, 1), Row(1, 2, 2)], [i for i in result])
+
     def test_from_pandas_with_names(self):
         # skip decimal as currently only decimal(38, 18) is supported
         pdf = self.pdf.drop(['f10', 'f11', 'f12', 'f13', 'f14', 'f15'], axis=1)
@@ -57,6 +57,28 @@ class RowBasedOperationTests(object):
         self.assert_equals(
             actual, ["+I[5, 18]", "+I[4, 8]", "+I[8, 72]", "+I[11, 162]", "+I[6, 32]"])
 
+    def test_map_with_registered_udf(self):
+        t = self.t_env.from_elements(
+            [(1, 2), (2, 1)],
+            DataTypes.ROW(
+                [DataTypes.FIELD("a", DataTypes.BIGINT()),
+                 DataTypes.FIELD("b", DataTypes.BIGINT())]))
+
+        table_sink = source_sink_utils.TestAppendSink(
+            ['a', 'b'],
+            [DataTypes.BIGINT(), DataTypes.BIGINT()])
+        self.t_env.register_table_sink("Results", table_sink)
+
+        func = udf(lambda x: Row(x.a + 1, x.b * 2), result_type=DataTypes.ROW(
+            [DataTypes.FIELD("a", DataTypes.BIGINT()),
+             DataTypes.FIELD("b", DataTypes.BIGINT())]))
+        # the Java function created during the registration doesn't take row as input
+        self.t_env.create_temporary_system_function("func", func)
+
+        t.map(func).execute_insert("Results").wait()
+        actual = source_sink_utils.results()
+        self.assert_equals(actual, ["+I[2, 4]", "+I[3, 2]"])
+
     def test_map_with_pandas_udf(self):
         t = self.t_env.from_elements(
             [(1, Row(2, 3)), (2, Row(1, 3)), (1, Row(5, 4)), (1, Row(8, 6)), (2, Row(3, 4))],
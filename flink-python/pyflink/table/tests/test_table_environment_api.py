@@ -18,6 +18,8 @@
 import datetime
 import decimal
 import sys
+from unittest import mock
+
 from py4j.protocol import Py4JJavaError
 
 from pyflink.common import RowKind
@@ -47,6 +49,23 @@ class TableEnvironmentTest(object):
             .getString(jvm.PythonOptions.PYTHON_EXECUTABLE.key(), None)
         self.assertEqual(sys.executable, actual_executable)
 
+    def test_add_jars_to_env_config_only_when_changed(self):
+        jar_url = "file:///tmp/pyflink-test.jar"
+        self.t_env.get_config().get_configuration().set_string("pipeline.jars", jar_url)
+        j_env_config = get_j_env_configuration(self.t_env._get_j_env())
+        self.t_env._before_execute()
+        self.assertIn(jar_url, j_env_config.getString("pipeline.jars", ""))
+
+        # neither the table config nor the env config has changed, no sync is needed
+        with mock.patch("pyflink.table.table_environment.get_jvm_attr") as get_jvm_attr:
+            self.t_env._before_execute()
+            get_jvm_attr.assert_not_called()
+
+        # the jars are added again after the env config is changed behind the table env
+        j_env_config.setString("pipeline.jars", "")
+        self.t_env._before_execute()
+        self.assertIn(jar_url, j_env_config.getString("pipeline.jars", ""))
+
     def test_explain(self):
         schema = RowType() \
             .add('a', DataTypes.INT()) \
@@ -90,6 +109,12 @@ class TableEnvironmentTest(object):
         expected = ['python_scalar_func', 'scalar_func', 'agg_func', 'table_func']
         self.assert_equals(actual, expected)
 
+    def test_get_catalog(self):
+        t_env = self.t_env
+        catalog = t_env.get_catalog(t_env.get_current_catalog())
+        self.assertIs(catalog, t_env.get_catalog(t_env.get_current_catalog()))
+        self.assertIsNone(t_env.get_catalog("nonexistent_catalog"))
+
     def test_load_module_twice(self):
         t_env = self.t_env
         self.check_list_modules('core')
@@ -227,6 +252,98 @@ class TableEnvironmentTest(object):
                                  .getTable())
         self.assertEqual("fake", table.get_options().get("connector"))
 
+    def test_scan(self):
+        t_env = self.t_env
+        t_env.create_temporary_view("`my.view`", t_env.from_elements([(1, 'Hi')], ['a', 'b']))
+
+        actual = t_env.scan(t_env.get_current_catalog(), t_env.get_current_database(),
+                            "my.view").get_schema().get_field_names()
+        self.assertEqual(['a', 'b'], actual)
+
+    def test_collect_for_primitive_data_types(self):
+        # all the fields are of primitive types, the elements are transferred in Arrow format
+        expected_result = [Row(1, 127, 32767, -2147483648, True, 1.5, 1.98932, 'pyflink'),
+                           Row(None, None, None, None, None, None, None, None)]
+        source = self.t_env.from_elements(
+            [(1, 127, 32767, -2147483648, True, 1.5, 1.98932, 'pyflink'),
+             (None, None, None, None, None, None, None, None)],
+            DataTypes.ROW([DataTypes.FIELD("a", DataTypes.BIGINT()),
+                           DataTypes.FIELD("b", DataTypes.TINYINT()),
+                           DataTypes.FIELD("c", DataTypes.SMALLINT()),
+                           DataTypes.FIELD("d", DataTypes.INT()),
+                           DataTypes.FIELD("e", DataTypes.BOOLEAN()),
+                           DataTypes.FIELD("f", DataTypes.FLOAT()),
+                           DataTypes.FIELD("g", DataTypes.DOUBLE()),
+                           DataTypes.FIELD("h", DataTypes.STRING())]))
+        table_result = source.execute()
+        with table_result.collect() as result:
+            collected_result = [i for i in result]
+            self.assertEqual(expected_result, collected_result)
+
+    def test_collect_for_date_binary_and_decimal_data_types(self):
+        # these types are also transferred in Arrow format
+        expected_result = [Row(datetime.date(2014, 9, 13), bytearray(b'pyflink'),
+                               decimal.Decimal('1000000000000000000.050000000000000000'),
+                               decimal.Decimal('12345678.90')),
+                           Row(None, None, None, None)]
+        source = self.t_env.from_elements(
+            [(datetime.date(2014, 9, 13), bytearray(b'pyflink'),
+              decimal.Decimal('1000000000000000000.05'), decimal.Decimal('12345678.9')),
+             (None, None, None, None)],
+            DataTypes.ROW([DataTypes.FIELD("a", DataTypes.DATE()),
+                           DataTypes.FIELD("b", DataTypes.BYTES()),
+                           DataTypes.FIELD("c", DataTypes.DECIMAL(38, 18)),
+                           DataTypes.FIELD("d", DataTypes.DECIMAL(10, 2))]))
+        with source.execute().collect() as result:
+            self.assertEqual(expected_result, [i for i in result])
+
+    def test_from_elements_with_rows(self):
+        # the rows are converted to tuples of the internal representation, e.g. the number of
+        # days since epoch of a date, before transferred in Arrow format
+        source = self.t_env.from_elements(
+            [Row(b=datetime.date(2014, 9, 13), a=1), Row(b=None, a=None)],
+            DataTypes.ROW([DataTypes.FIELD("a", DataTypes.BIGINT()),
+                           DataTypes.FIELD("b", DataTypes.DATE())]))
+        with source.execute().collect() as result:
+            self.assertEqual([Row(1, datetime.date(2014, 9, 13)), Row(None, None)],
+                             [i for i in result])
+
+    def test_from_elements_with_arrow_table(self):
+        import pyarrow as pa
+        arrow_table = pa.Table.from_pydict({'x': [1, 2, None], 'y': ['a', None, 'c']})
+        source = self.t_env.from_elements(arrow_table, ['a', 'b'])
+        self.assertEqual(['a', 'b'], source.get_schema().get_field_names())
+        with source.execute().collect() as result:
+            self.assertEqual([Row(1, 'a'), Row(2, None), Row(None, 'c')], [i for i in result])
+
+        source = self.t_env.from_elements(
+            arrow_table.to_batches()[0], [DataTypes.INT(), DataTypes.STRING()])
+        self.assertEqual([DataTypes.INT(), DataTypes.STRING()],
+                         source.get_schema().get_field_data_types())
+        with source.execute().collect() as result:
+            self.assertEqual([Row(1, 'a'), Row(2, None), Row(None, 'c')], [i for i in result])
+
+    def test_from_elements_with_numpy_and_pandas(self):
+        import numpy as np
+        import pandas as pd
+        source = self.t_env.from_elements(np.array([[1, 2], [3, 4]], dtype=np.int32))
+        self.assertEqual(['_1', '_2'], source.get_schema().get_field_names())
+        self.assertEqual([DataTypes.INT(), DataTypes.INT()],
+                         source.get_schema().get_field_data_types())
+        with source.execute().collect() as result:
+            self.assertEqual([Row(1, 2), Row(3, 4)], [i for i in result])
+
+        source = self.t_env.from_elements(np.array([1, 4294967295], dtype=np.uint32))
+        self.assertEqual([DataTypes.BIGINT()], source.get_schema().get_field_data_types())
+        with source.execute().collect() as result:
+            self.assertEqual([Row(1), Row(4294967295)], [i for i in result])
+
+        source = self.t_env.from_elements(
+            pd.DataFrame({'x': [1.5, 2.5], 'y': [True, False]}), ['a', 'b'])
+        self.assertEqual(['a', 'b'], source.get_schema().get_field_names())
+        with source.execute().collect() as result:
+            self.assertEqual([Row(1.5, True), Row(2.5, False)], [i for i in result])
+
 
 class DataStreamConversionTestCases(object):
 
@@ -364,7 +481,7 @@ class StreamTableEnvironmentTests(TableEnvironmentTest, PyFlinkStreamTableTestCa
             self.assertEqual(expected_result, collected_result)
 
 
-class BatchTableEnvironmentTests(PyFlinkBatchTableTestCase):
+class BatchTableEnvironmentTests(TableEnvironmentTest, PyFlinkBatchTableTestCase):
 
     def test_explain_with_multi_sinks(self):
         t_env = self.t_env
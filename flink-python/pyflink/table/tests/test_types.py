@@ -32,11 +32,13 @@ from pyflink.table.types import (_infer_schema_from_data, _infer_type,
                                  _array_signed_int_typecode_ctype_mappings,
                                  _array_unsigned_int_typecode_ctype_mappings,
                                  _array_type_mappings, _merge_type,
-                                 _create_type_verifier, UserDefinedType, DataTypes, Row, RowField,
-                                 RowType, ArrayType, BigIntType, VarCharType, MapType, DataType,
+                                 _create_type_verifier, _get_type_verifier, UserDefinedType,
+                                 DataTypes, Row, RowField, RowType, ArrayType, BigIntType,
+                                 VarCharType, MapType, DataType,
                                  _to_java_type, _from_java_type, ZonedTimestampType,
-                                 LocalZonedTimestampType)
+                                 LocalZonedTimestampType, _to_java_data_type)
 from pyflink.testing.test_case_utils import PyFlinkTestCase
+from pyflink.util.java_utils import to_jarray
 
 
 class ExamplePointUDT(UserDefinedType):
@@ -799,6 +801,17 @@ class DataTypeVerificationTests(PyFlinkTestCase):
             with self.assertRaises(exp, msg=msg):
                 _create_type_verifier(data_type.not_null())(obj)
 
+    def test_cached_type_verifier(self):
+        schema = RowType().add("a", BigIntType())
+        verifier = _get_type_verifier(schema)
+        self.assertIs(verifier, _get_type_verifier(RowType().add("a", BigIntType())))
+
+        # the verifier of a data type modified after it was cached must not be reused
+        schema.add("b", VarCharType(100, False))
+        self.assertIsNot(verifier, _get_type_verifier(schema))
+        with self.assertRaises(ValueError):
+            _get_type_verifier(schema)((1, None))
+
 
 class DataTypeConvertTests(PyFlinkTestCase):
 
@@ -913,6 +926,24 @@ class DataTypeConvertTests(PyFlinkTestCase):
 
         self.assertEqual(test_types, converted_python_types)
 
+    def test_row_type_to_java_data_type(self):
+        JDataTypes = get_gateway().jvm.DataTypes
+        row_type = DataTypes.ROW([DataTypes.FIELD("a", DataTypes.INT(False)),
+                                  DataTypes.FIELD("b`c", DataTypes.ARRAY(DataTypes.STRING())),
+                                  DataTypes.FIELD("d", DataTypes.MAP(DataTypes.DECIMAL(10, 2),
+                                                                     DataTypes.TIMESTAMP_LTZ(3))),
+                                  DataTypes.FIELD("e", DataTypes.ROW(
+                                      [DataTypes.FIELD("f", DataTypes.BYTES())], False))])
+
+        expected = JDataTypes.ROW(to_jarray(JDataTypes.Field, [
+            JDataTypes.FIELD("a", JDataTypes.INT().notNull()),
+            JDataTypes.FIELD("b`c", JDataTypes.ARRAY(JDataTypes.STRING())),
+            JDataTypes.FIELD("d", JDataTypes.MAP(JDataTypes.DECIMAL(10, 2),
+                                                 JDataTypes.TIMESTAMP_WITH_LOCAL_TIME_ZONE(3))),
+            JDataTypes.FIELD("e", JDataTypes.ROW(to_jarray(JDataTypes.Field, [
+                JDataTypes.FIELD("f", JDataTypes.BYTES())])).notNull())]))
+        self.assertTrue(expected.equals(_to_java_data_type(row_type)))
+
     def test_list_view_type(self):
         test_types = [DataTypes.LIST_VIEW(DataTypes.BIGINT()),
                       DataTypes.LIST_VIEW(DataTypes.STRING())]
@@ -23,7 +23,7 @@ import decimal
 import sys
 import time
 from array import array
-from copy import copy
+from copy import copy, deepcopy
 from enum import Enum
 from functools import reduce
 from threading import RLock
@@ -32,7 +32,7 @@ from py4j.java_gateway import get_java_class
 from typing import List, Union
 
 from pyflink.common.types import _create_row
-from pyflink.util.java_utils import to_jarray, is_instance_of
+from pyflink.util.java_utils import to_jarray, is_instance_of, get_jvm_attr
 from pyflink.java_gateway import get_gateway
 from pyflink.common import Row, RowKind
 
@@ -1931,6 +1931,72 @@ def _from_java_type(j_data_type):
         TypeError("Unsupported data type: %s" % j_data_type)
 
 
+def _to_ddl_string(data_type: DataType):
+    """
+    Converts the specified Python DataType to its SQL DDL representation, e.g.
+    "ROW<`a` INT NOT NULL, `b` VARCHAR(2147483647)>". Returns None if the data type or one of
+    its nested types has no DDL representation which maps to the same Java DataType.
+    """
+    if isinstance(data_type, BooleanType):
+        ddl = "BOOLEAN"
+    elif isinstance(data_type, TinyIntType):
+        ddl = "TINYINT"
+    elif isinstance(data_type, SmallIntType):
+        ddl = "SMALLINT"
+    elif isinstance(data_type, IntType):
+        ddl = "INT"
+    elif isinstance(data_type, BigIntType):
+        ddl = "BIGINT"
+    elif isinstance(data_type, FloatType):
+        ddl = "FLOAT"
+    elif isinstance(data_type, DoubleType):
+        ddl = "DOUBLE"
+    elif isinstance(data_type, VarCharType):
+        ddl = "VARCHAR(%d)" % data_type.length
+    elif isinstance(data_type, CharType):
+        ddl = "CHAR(%d)" % data_type.length
+    elif isinstance(data_type, VarBinaryType):
+        ddl = "VARBINARY(%d)" % data_type.length
+    elif isinstance(data_type, BinaryType):
+        ddl = "BINARY(%d)" % data_type.length
+    elif isinstance(data_type, DecimalType):
+        ddl = "DECIMAL(%d, %d)" % (data_type.precision, data_type.scale)
+    elif isinstance(data_type, DateType):
+        ddl = "DATE"
+    elif isinstance(data_type, TimeType):
+        ddl = "TIME(%d)" % data_type.precision
+    elif isinstance(data_type, TimestampType):
+        ddl = "TIMESTAMP(%d)" % data_type.precision
+    elif isinstance(data_type, LocalZonedTimestampType):
+        ddl = "TIMESTAMP(%d) WITH LOCAL TIME ZONE" % data_type.precision
+    elif isinstance(data_type, ZonedTimestampType):
+        ddl = "TIMESTAMP(%d) WITH TIME ZONE" % data_type.precision
+    elif isinstance(data_type, (ArrayType, MultisetType)):
+        element_ddl = _to_ddl_string(data_type.element_type)
+        if element_ddl is None:
+            return None
+        ddl = "%s<%s>" % ("ARRAY" if isinstance(data_type, ArrayType) else "MULTISET",
+                          element_ddl)
+    elif isinstance(data_type, MapType):
+        key_ddl = _to_ddl_string(data_type.key_type)
+        value_ddl = _to_ddl_string(data_type.value_type)
+        if key_ddl is None or value_ddl is None:
+            return None
+        ddl = "MAP<%s, %s>" % (key_ddl, value_ddl)
+    elif isinstance(data_type, RowType):
+        field_ddls = []
+        for field in data_type.fields:
+            field_ddl = _to_ddl_string(field.data_type)
+            if field_ddl is None:
+                return None
+            field_ddls.append("`%s` %s" % (field.name.replace("`", "``"), field_ddl))
+        ddl = "ROW<%s>" % ", ".join(field_ddls)
+    else:
+        return None
+
+    return ddl if data_type._nullable else ddl + " NOT NULL"
+
+
 def _to_java_data_type(data_type: DataType):
     """
     Converts the specified Python DataType to Java DataType.
@@ -1938,6 +2004,15 @@ def _to_java_data_type(data_type: DataType):
     gateway = get_gateway()
     JDataTypes = gateway.jvm.org.apache.flink.table.api.DataTypes
 
+    if isinstance(data_type, RowType):
+        # parses the whole row type on the Java side at once instead of building it field by
+        # field, which takes several Py4J round trips per field
+        ddl = _to_ddl_string(data_type)
+        if ddl is not None:
+            return get_jvm_attr("org.apache.flink.table.types.utils.TypeConversions") \
+                .fromLogicalToDataType(get_jvm_attr(
+                    "org.apache.flink.table.types.logical.utils.LogicalTypeParser").parse(ddl))
+
     if isinstance(data_type, BooleanType):
         j_data_type = JDataTypes.BOOLEAN()
     elif isinstance(data_type, TinyIntType):
@@ -2239,8 +2314,12 @@ def _create_type_verifier(data_type: DataType, name: str = None):
         for f in data_type.fields:
             verifier = _create_type_verifier(f.data_type, name=new_name(f.name))
             verifiers.append((f.name, verifier))
+        check_flat_row = _create_flat_row_checker(data_type)
 
         def verify_row_field(obj):
+            if check_flat_row is not None and isinstance(obj, (tuple, list)) \
+                    and check_flat_row(obj):
+                return
             if isinstance(obj, dict):
                 for f, verifier in verifiers:
                     verifier(obj.get(f))
@@ -2278,6 +2357,87 @@ def _create_type_verifier(data_type: DataType, name: str = None):
     return verify
 
 
+# The value ranges of the integer types which are narrower than the python int.
+_int_type_ranges = {
+    TinyIntType: (-128, 127),
+    SmallIntType: (-32768, 32767),
+    IntType: (-2147483648, 2147483647),
+}
+
+# The types whose values could be verified with a type check and optionally a range or length check.
+_flat_verified_types = {BooleanType, TinyIntType, SmallIntType, IntType, BigIntType, FloatType,
+                        DoubleType, DecimalType, VarCharType, VarBinaryType, DateType, TimeType,
+                        TimestampType, LocalZonedTimestampType}
+
+
+def _create_flat_row_checker(row_type: RowType):
+    """
+    Creates a function which checks all the fields of a tuple in a single loop if all the fields of
+    the row type are of flat types, which avoids calling the verifier of each field. It returns
+    False if the tuple doesn't pass the check, in which case the field verifiers should be used to
+    report the error. Returns None if the row type contains fields of other types.
+    """
+    specs = []
+    for field_type in row_type.field_types():
+        _type = type(field_type)
+        if _type not in _flat_verified_types:
+            return None
+        lower, upper = _int_type_ranges.get(_type, (None, None))
+        max_length = field_type.length if _type in (VarCharType, VarBinaryType) else None
+        specs.append((_acceptable_types[_type], field_type._nullable, lower, upper, max_length))
+    arity = len(specs)
+
+    def check_flat_row(obj):
+        if len(obj) != arity:
+            return False
+        for v, (types, nullable, lower, upper, max_length) in zip(obj, specs):
+            if v is None:
+                if not nullable:
+                    return False
+            elif type(v) not in types \
+                    or (lower is not None and not lower <= v <= upper) \
+                    or (max_length is not None and len(v) > max_length):
+                return False
+        return True
+
+    return check_flat_row
+
+
+# The maximum number of type verifiers, converters and Arrow schemas cached for the data types seen
+# recently.
+_MAX_CACHED_TYPE_FUNCTIONS = 32
+_type_verifiers = {}
+_converters = {}
+_arrow_schemas = {}
+
+
+def _get_cached_type_function(cache, create_func, data_type: DataType, *args):
+    # data types are mutable, e.g. RowType.add, so the cache holds a copy of the data type which
+    # could not change after the function has been created for it
+    key = (data_type,) + args
+    func = cache.get(key)
+    if func is None:
+        func = create_func(data_type, *args)
+        if len(cache) >= _MAX_CACHED_TYPE_FUNCTIONS:
+            cache.clear()
+        cache[(deepcopy(data_type),) + args] = func
+    return func
+
+
+def _get_type_verifier(data_type: DataType, name: str = None):
+    """
+    Returns the type verifier of the data type, which is only created once for equal data types.
+    """
+    return _get_cached_type_function(_type_verifiers, _create_type_verifier, data_type, name)
+
+
+def _get_converter(data_type: DataType):
+    """
+    Returns the converter of the data type, which is only created once for equal data types.
+    """
+    return _get_cached_type_function(_converters, _create_converter, data_type)
+
+
 def create_arrow_schema(field_names: List[str], field_types: List[DataType]):
     """
     Create an Arrow schema with the specified filed names and types.
@@ -2288,6 +2448,14 @@ def create_arrow_schema(field_names: List[str], field_types: List[DataType]):
     return pa.schema(fields)
 
 
+def _get_arrow_schema(row_type: RowType):
+    """
+    Returns the Arrow schema of the row type, which is only created once for equal row types.
+    """
+    return _get_cached_type_function(
+        _arrow_schemas, lambda t: create_arrow_schema(t.field_names(), t.field_types()), row_type)
+
+
 def from_arrow_type(arrow_type, nullable: bool = True) -> DataType:
     """
     Convert Arrow type to Flink data type.
@@ -359,7 +359,10 @@ class UserDefinedFunctionWrapper(object):
         return self
 
     def _set_takes_row_as_input(self):
-        self._takes_row_as_input = True
+        if not self._takes_row_as_input:
+            self._takes_row_as_input = True
+            # the cached Java function was created with the previous input format
+            self._judf_placeholder = None
         return self
 
     def _java_user_defined_function(self):
@@ -386,8 +389,8 @@ class UserDefinedFunctionWrapper(object):
             if not isinstance(self._func, UserDefinedFunction):
                 func = self._create_delegate_function()
 
-            import cloudpickle
-            serialized_func = cloudpickle.dumps(func)
+            from pyflink.fn_execution import pickle
+            serialized_func = pickle.dumps(func)
             self._judf_placeholder = \
                 self._create_judf(serialized_func, j_input_types, j_function_kind)
         return self._judf_placeholder
@@ -21,9 +21,12 @@ from pyflink.common.types import RowKind
 
 from pyflink.java_gateway import get_gateway
 from pyflink.table.types import DataType, LocalZonedTimestampType, Row, RowType, \
-    TimeType, DateType, ArrayType, MapType, TimestampType, FloatType
+    TimeType, DateType, ArrayType, MapType, TimestampType, FloatType, TinyIntType, SmallIntType, \
+    IntType, BigIntType, BooleanType, DoubleType, VarCharType, VarBinaryType, DecimalType, \
+    to_arrow_type
 from pyflink.util.java_utils import to_jarray
 import datetime
+import decimal
 import pickle
 
 
@@ -55,6 +58,55 @@ def pandas_to_arrow(schema, timezone, field_types, series):
     return pa.RecordBatch.from_arrays(arrays, schema)
 
 
+# The types whose internal SQL representation could be transferred in Arrow format as is, e.g. a
+# date is represented as the number of days since epoch, which is also what Arrow's date32 holds,
+# mapped to the python types of the values Arrow converts without coercion. Other values, e.g. a
+# float of a BIGINT field, are left to the pickle path, which fails or converts them explicitly.
+_ARROW_COMPATIBLE_TYPES = {
+    TinyIntType: (int,),
+    SmallIntType: (int,),
+    IntType: (int,),
+    BigIntType: (int,),
+    BooleanType: (bool,),
+    FloatType: (float,),
+    DoubleType: (float,),
+    VarCharType: (str,),
+    VarBinaryType: (bytearray, bytes),
+    DecimalType: (decimal.Decimal,),
+    DateType: (datetime.date, int),
+}
+
+
+def rows_to_arrow(row_type: RowType, rows):
+    """
+    Converts the rows into an Arrow RecordBatch. The fields of the rows could either be python
+    objects, e.g. datetime.date, or already be converted to the internal SQL representation.
+    Returns None if the rows could not be converted, e.g. the row type contains fields of time,
+    timestamp or composite types or a value is not of the python type of its field, for which the
+    caller should fall back to pickle.
+    """
+    field_types = row_type.field_types()
+    if not field_types or any(type(t) not in _ARROW_COMPATIBLE_TYPES for t in field_types):
+        return None
+    arity = len(field_types)
+    if any(row is None or len(row) != arity for row in rows):
+        return None
+
+    import pyarrow as pa
+    columns = list(zip(*rows)) if rows else [[] for _ in field_types]
+    for column, t in zip(columns, field_types):
+        python_types = _ARROW_COMPATIBLE_TYPES[type(t)]
+        # the exact types are checked, as e.g. a bool is also an int
+        if any(value is not None and type(value) not in python_types for value in column):
+            return None
+    try:
+        arrays = [pa.array(column, type=to_arrow_type(t))
+                  for column, t in zip(columns, field_types)]
+    except (pa.ArrowException, TypeError, ValueError, OverflowError):
+        return None
+    return pa.RecordBatch.from_arrays(arrays, row_type.field_names())
+
+
 def arrow_to_pandas(timezone, field_types, batches):
     def arrow_column_to_pandas(arrow_column, t: DataType):
         if type(t) == RowType:
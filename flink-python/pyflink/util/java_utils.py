@@ -16,13 +16,34 @@
 # limitations under the License.
 ################################################################################
 
+import pickle
 from datetime import timedelta
+from functools import lru_cache
 
 from py4j.java_gateway import JavaClass, get_java_class, JavaObject
 
 from pyflink.java_gateway import get_gateway
 
 
+def get_jvm_attr(name):
+    """
+    Returns the attribute of the JVM view with the given dotted name, e.g. "String" or
+    "org.apache.flink.table.functions.TableFunction". Each step of the lookup is a Py4J round
+    trip, so the result is cached per gateway and reused by the subsequent calls.
+
+    :param name: The dotted name of the Java class or static member.
+    """
+    return _get_jvm_attr(get_gateway(), name)
+
+
+@lru_cache(maxsize=128)
+def _get_jvm_attr(gateway, name):
+    attr = gateway.jvm
+    for part in name.split('.'):
+        attr = getattr(attr, part)
+    return attr
+
+
 def to_jarray(j_type, arr):
     """
     Convert python list to java type array
@@ -37,6 +58,36 @@ def to_jarray(j_type, arr):
     return j_arr
 
 
+def from_j_string_array(j_arr):
+    """
+    Convert java String array to python list. The whole array is pickled in java and transferred
+    in a single call instead of fetching the elements one by one.
+
+    :param j_arr: java String array
+    """
+    return pickle.loads(get_jvm_attr("PythonBridgeUtils").pickleStringArray(j_arr))
+
+
+def from_j_string_list(j_list):
+    """
+    Convert java List of String to python list. The whole list is pickled in java and transferred
+    in a single call instead of iterating over the elements one by one.
+
+    :param j_list: java List of String
+    """
+    return pickle.loads(get_jvm_attr("PythonBridgeUtils").pickleStringList(j_list))
+
+
+def to_j_string_array(arr):
+    """
+    Convert python list of str to java String array. The list is pickled and transferred in a
+    single call instead of setting the elements one by one.
+
+    :param arr: python list of str
+    """
+    return get_jvm_attr("PythonBridgeUtils").unpickleStringArray(pickle.dumps(list(arr), 3))
+
+
 def to_j_flink_time(time_delta):
     gateway = get_gateway()
     TimeUnit = gateway.jvm.java.util.concurrent.TimeUnit
@@ -55,10 +106,27 @@ def from_j_flink_time(j_flink_time):
     return timedelta(milliseconds=total_milliseconds)
 
 
-def load_java_class(class_name):
+# the gateway and the context class loader of the gateway server retrieved from it
+_context_classloader = (None, None)
+
+
+def get_context_classloader():
+    """
+    Returns the context class loader of the Python gateway server. It is cached per gateway as
+    retrieving it takes several Py4J round trips, and is updated when jars are added to it via
+    :func:`add_jars_to_context_class_loader`.
+    """
+    global _context_classloader
     gateway = get_gateway()
-    context_classloader = gateway.jvm.Thread.currentThread().getContextClassLoader()
-    return context_classloader.loadClass(class_name)
+    cached_gateway, context_classloader = _context_classloader
+    if cached_gateway is not gateway:
+        context_classloader = gateway.jvm.Thread.currentThread().getContextClassLoader()
+        _context_classloader = (gateway, context_classloader)
+    return context_classloader
+
+
+def load_java_class(class_name):
+    return get_context_classloader().loadClass(class_name)
 
 
 def is_instance_of(java_object, java_class):
@@ -121,7 +189,7 @@ def add_jars_to_context_class_loader(jar_urls):
     gateway = get_gateway()
     # validate and normalize
     jar_urls = [gateway.jvm.java.net.URL(url).toString() for url in jar_urls]
-    context_classloader = gateway.jvm.Thread.currentThread().getContextClassLoader()
+    context_classloader = get_context_classloader()
     existing_urls = []
     if context_classloader.getClass().getName() == "java.net.URLClassLoader":
         existing_urls = set([url.toString() for url in context_classloader.getURLs()])
@@ -134,24 +202,33 @@ def add_jars_to_context_class_loader(jar_urls):
     new_classloader = gateway.jvm.java.net.URLClassLoader(
         to_jarray(gateway.jvm.java.net.URL, j_urls), context_classloader)
     gateway.jvm.Thread.currentThread().setContextClassLoader(new_classloader)
+    global _context_classloader
+    _context_classloader = (gateway, new_classloader)
 
 
 def to_j_explain_detail_arr(p_extra_details):
+    # the same few combinations of explain details are used over and over again, so the Java
+    # arrays are cached instead of being filled element by element on every call
+    return _to_j_explain_detail_arr(get_gateway(), tuple(p_extra_details or ()))
+
+
+@lru_cache(maxsize=32)
+def _to_j_explain_detail_arr(gateway, p_extra_details):
     # sphinx will check "import loop" when generating doc,
     # use local import to avoid above error
     from pyflink.table.explain_detail import ExplainDetail
-    gateway = get_gateway()
+    JExplainDetail = gateway.jvm.org.apache.flink.table.api.ExplainDetail
 
     def to_j_explain_detail(p_extra_detail):
         if p_extra_detail == ExplainDetail.JSON_EXECUTION_PLAN:
-            return gateway.jvm.org.apache.flink.table.api.ExplainDetail.JSON_EXECUTION_PLAN
+            return JExplainDetail.JSON_EXECUTION_PLAN
         elif p_extra_detail == ExplainDetail.CHANGELOG_MODE:
-            return gateway.jvm.org.apache.flink.table.api.ExplainDetail.CHANGELOG_MODE
+            return JExplainDetail.CHANGELOG_MODE
         else:
-            return gateway.jvm.org.apache.flink.table.api.ExplainDetail.ESTIMATED_COST
+            return JExplainDetail.ESTIMATED_COST
 
-    _len = len(p_extra_details) if p_extra_details else 0
-    j_arr = gateway.new_array(gateway.jvm.org.apache.flink.table.api.ExplainDetail, _len)
+    _len = len(p_extra_details)
+    j_arr = gateway.new_array(JExplainDetail, _len)
     for i in range(0, _len):
         j_arr[i] = to_j_explain_detail(p_extra_details[i])
 
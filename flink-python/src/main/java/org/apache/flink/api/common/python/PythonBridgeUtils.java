@@ -30,6 +30,7 @@ import org.apache.flink.api.java.typeutils.MapTypeInfo;
 import org.apache.flink.api.java.typeutils.RowTypeInfo;
 import org.apache.flink.api.java.typeutils.TupleTypeInfo;
 import org.apache.flink.api.java.typeutils.TupleTypeInfoBase;
+import org.apache.flink.table.module.ModuleEntry;
 import org.apache.flink.table.types.DataType;
 import org.apache.flink.table.types.logical.ArrayType;
 import org.apache.flink.table.types.logical.DateType;
@@ -46,10 +47,12 @@ import net.razorvine.pickle.Unpickler;
 import org.apache.calcite.rex.RexLiteral;
 import org.apache.calcite.sql.type.SqlTypeName;
 
+import java.io.ByteArrayInputStream;
 import java.io.DataInputStream;
 import java.io.EOFException;
 import java.io.FileInputStream;
 import java.io.IOException;
+import java.io.InputStream;
 import java.math.BigDecimal;
 import java.sql.Date;
 import java.sql.Time;
@@ -84,7 +87,22 @@ public final class PythonBridgeUtils {
 
     public static List<Object[]> readPythonObjects(String fileName, boolean batched)
             throws IOException {
-        List<byte[]> data = readPickledBytes(fileName);
+        return unpickleObjects(readPickledBytes(fileName), batched);
+    }
+
+    /**
+     * Reads the Python objects from the given serialized data, which is in the same format as the
+     * file read by {@link #readPythonObjects(String, boolean)}. It allows the Python API to pass
+     * small data directly instead of going through a temporary file.
+     */
+    public static List<Object[]> readPythonObjects(byte[] serializedData, boolean batched)
+            throws IOException {
+        return unpickleObjects(
+                readPickledBytes(new ByteArrayInputStream(serializedData)), batched);
+    }
+
+    private static List<Object[]> unpickleObjects(List<byte[]> data, boolean batched)
+            throws IOException {
         Unpickler unpickle = new Unpickler();
         initialize();
         List<Object[]> unpickledData = new ArrayList<>();
@@ -199,8 +217,12 @@ public final class PythonBridgeUtils {
     }
 
     public static List<byte[]> readPickledBytes(final String fileName) throws IOException {
+        return readPickledBytes(new FileInputStream(fileName));
+    }
+
+    private static List<byte[]> readPickledBytes(InputStream in) throws IOException {
         List<byte[]> objs = new LinkedList<>();
-        try (DataInputStream din = new DataInputStream(new FileInputStream(fileName))) {
+        try (DataInputStream din = new DataInputStream(in)) {
             try {
                 while (true) {
                     final int length = din.readInt();
@@ -215,6 +237,31 @@ public final class PythonBridgeUtils {
         return objs;
     }
 
+    /** Pickles the given strings as a Python list, so that they could be fetched in one call. */
+    public static byte[] pickleStringArray(String[] strings) throws IOException {
+        return new Pickler().dumps(Arrays.asList(strings));
+    }
+
+    /** Pickles the given strings as a Python list, so that they could be fetched in one call. */
+    public static byte[] pickleStringList(List<String> strings) throws IOException {
+        return new Pickler().dumps(strings);
+    }
+
+    /** Unpickles the given Python list of strings, so that it could be passed in one call. */
+    public static String[] unpickleStringArray(byte[] pickledStrings) throws IOException {
+        Object obj = new Unpickler().loads(pickledStrings);
+        return ((List<?>) obj).toArray(new String[0]);
+    }
+
+    /** Pickles the given module entries as a Python list of (name, used) tuples. */
+    public static byte[] pickleModuleEntries(ModuleEntry[] entries) throws IOException {
+        List<Object[]> result = new ArrayList<>(entries.length);
+        for (ModuleEntry entry : entries) {
+            result.add(new Object[] {entry.name(), entry.used()});
+        }
+        return new Pickler().dumps(result);
+    }
+
     private static Object getPickledBytesFromJavaObject(Object obj, LogicalType dataType)
             throws IOException {
         Pickler pickler = new Pickler();
@@ -48,7 +48,11 @@ import org.apache.flink.table.api.TableException;
 import java.lang.reflect.Field;
 import java.lang.reflect.InvocationTargetException;
 import java.lang.reflect.Method;
+import java.net.MalformedURLException;
+import java.net.URL;
+import java.util.LinkedHashSet;
 import java.util.List;
+import java.util.Set;
 
 /**
  * A Util class to get the {@link StreamExecutionEnvironment} configuration and merged configuration
@@ -190,6 +194,24 @@ public class PythonConfigUtil {
         }
     }
 
+    /**
+     * Adds the given jar urls separated by ";" to the jar urls of the given config option. The
+     * given urls are normalized and the duplicate urls are removed.
+     */
+    public static void addJarUrls(Configuration config, String key, String jarUrls)
+            throws MalformedURLException {
+        Set<String> urls = new LinkedHashSet<>();
+        for (String url : jarUrls.split(";")) {
+            urls.add(new URL(url).toString());
+        }
+        for (String url : config.getString(key, "").split(";")) {
+            if (!url.isEmpty()) {
+                urls.add(url);
+            }
+        }
+        config.setString(key, String.join(";", urls));
+    }
+
     /**
      * Configure the {@link OneInputPythonFunctionOperator} to be chained with the
      * upstream/downstream operator by setting their parallelism, slot sharing group, co-location
@@ -146,6 +146,29 @@ public class PythonDependencyUtils {
         config.addAll(toMerge);
     }
 
+    /**
+     * Adds an entry to the {@link #FILE_DELIMITER} separated list stored under the given key, e.g.
+     * {@link PythonOptions#PYTHON_FILES}. It allows the Python API to add an entry without
+     * transferring the existing entries back and forth.
+     *
+     * @param config The configuration to update.
+     * @param key The key of the list.
+     * @param entry The entry to add.
+     * @param prepend Whether to add the entry in front of the existing entries.
+     */
+    public static void addToFileList(
+            Configuration config, String key, String entry, boolean prepend) {
+        String entries = config.getString(key, null);
+        if (entries == null) {
+            entries = entry;
+        } else if (prepend) {
+            entries = String.join(FILE_DELIMITER, entry, entries);
+        } else {
+            entries = String.join(FILE_DELIMITER, entries, entry);
+        }
+        config.setString(key, entries);
+    }
+
     /** Helper class for Python dependency management. */
     private static class PythonDependencyManager {
 
@@ -129,6 +129,7 @@ import org.apache.arrow.vector.types.pojo.Schema;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
+import java.io.ByteArrayInputStream;
 import java.io.ByteArrayOutputStream;
 import java.io.EOFException;
 import java.io.FileInputStream;
@@ -412,6 +413,17 @@ public final class ArrowUtils {
         }
     }
 
+    /**
+     * Creates an {@link ArrowTableSource} from the given serialized Arrow stream. It allows the
+     * Python API to pass small data directly instead of going through a temporary file.
+     */
+    public static ArrowTableSource createArrowTableSource(DataType dataType, byte[] arrowData)
+            throws IOException {
+        return new ArrowTableSource(
+                dataType,
+                readArrowBatches(Channels.newChannel(new ByteArrayInputStream(arrowData))));
+    }
+
     public static byte[][] readArrowBatches(ReadableByteChannel channel) throws IOException {
         List<byte[]> results = new ArrayList<>();
         byte[] batch;
@@ -26,6 +26,7 @@ import org.apache.flink.streaming.api.graph.StreamGraph;
 import org.junit.Test;
 
 import java.lang.reflect.InvocationTargetException;
+import java.net.MalformedURLException;
 import java.util.Collections;
 
 import static org.junit.Assert.assertEquals;
@@ -57,4 +58,16 @@ public class PythonConfigUtilTest {
         StreamGraph streamGraph = PythonConfigUtil.generateStreamGraphWithDependencies(env, true);
         assertEquals(jobName, streamGraph.getJobName());
     }
+
+    @Test
+    public void testAddJarUrls() throws MalformedURLException {
+        Configuration config = new Configuration();
+        PythonConfigUtil.addJarUrls(config, "pipeline.jars", "file:/tmp/a.jar;file:/tmp/b.jar");
+        assertEquals("file:/tmp/a.jar;file:/tmp/b.jar", config.getString("pipeline.jars", null));
+
+        PythonConfigUtil.addJarUrls(config, "pipeline.jars", "file:/tmp/c.jar;file:/tmp/a.jar");
+        assertEquals(
+                "file:/tmp/c.jar;file:/tmp/a.jar;file:/tmp/b.jar",
+                config.getString("pipeline.jars", null));
+    }
 }
@@ -40,6 +40,7 @@ import static org.apache.flink.python.util.PythonDependencyUtils.FILE;
 import static org.apache.flink.python.util.PythonDependencyUtils.PYTHON_ARCHIVES;
 import static org.apache.flink.python.util.PythonDependencyUtils.PYTHON_FILES;
 import static org.apache.flink.python.util.PythonDependencyUtils.PYTHON_REQUIREMENTS_FILE;
+import static org.apache.flink.python.util.PythonDependencyUtils.addToFileList;
 import static org.apache.flink.python.util.PythonDependencyUtils.configurePythonDependencies;
 import static org.apache.flink.python.util.PythonDependencyUtils.merge;
 import static org.junit.Assert.assertEquals;
@@ -234,6 +235,18 @@ public class PythonDependencyUtilsTest {
         verifyConfiguration(expectedConfiguration, config);
     }
 
+    @Test
+    public void testAddToFileList() {
+        Configuration config = new Configuration();
+        addToFileList(config, PythonOptions.PYTHON_FILES.key(), "file1.py", true);
+        addToFileList(config, PythonOptions.PYTHON_FILES.key(), "file2.py", true);
+        addToFileList(config, PythonOptions.PYTHON_ARCHIVES.key(), "file1.zip", false);
+        addToFileList(config, PythonOptions.PYTHON_ARCHIVES.key(), "file2.zip#dir", false);
+
+        assertEquals("file2.py,file1.py", config.get(PythonOptions.PYTHON_FILES));
+        assertEquals("file1.zip,file2.zip#dir", config.get(PythonOptions.PYTHON_ARCHIVES));
+    }
+
     private void verifyCachedFiles(Map<String, String> expected) {
         Map<String, String> actual =
                 cachedFiles.stream().collect(Collectors.toMap(t -> t.f0, t -> t.f1.filePath));
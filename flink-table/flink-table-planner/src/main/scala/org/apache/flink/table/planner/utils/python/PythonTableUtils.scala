@@ -31,7 +31,10 @@ import org.apache.flink.api.java.io.CollectionInputFormat
 import org.apache.flink.api.java.tuple.Tuple
 import org.apache.flink.api.java.typeutils.{MapTypeInfo, ObjectArrayTypeInfo, RowTypeInfo, TupleTypeInfo}
 import org.apache.flink.core.io.InputSplit
-import org.apache.flink.table.api.{TableSchema, Types}
+import org.apache.flink.table.api.{TableEnvironment, TableSchema, Types}
+import org.apache.flink.table.api.internal.TableEnvironmentImpl
+import org.apache.flink.table.catalog.FunctionCatalog
+import org.apache.flink.table.functions.{ImperativeAggregateFunction, ScalarFunction, TableFunction, UserDefinedFunction, UserDefinedFunctionHelper}
 import org.apache.flink.table.sources.InputFormatTableSource
 import org.apache.flink.types.Row
 
@@ -431,6 +434,65 @@ object PythonTableUtils {
     }
   }
 
+  /**
+    * Registers a user-defined function via the legacy function registration of a
+    * [[TableEnvironmentImpl]]. The kind of the function is determined here, so that the Python
+    * API only needs a single call instead of probing the function class remotely.
+    *
+    * @param tEnv The table environment, which must be a [[TableEnvironmentImpl]].
+    * @param name The name under which the function is registered.
+    * @param function The scalar, table or aggregate function to register.
+    */
+  def registerLegacyFunction(
+      tEnv: TableEnvironment,
+      name: String,
+      function: UserDefinedFunction): Unit = {
+    function match {
+      case tableFunction: TableFunction[_] =>
+        registerTableFunction(
+          getFunctionCatalog(tEnv), name, tableFunction.asInstanceOf[TableFunction[Any]])
+      case aggregateFunction: ImperativeAggregateFunction[_, _] =>
+        registerAggregateFunction(
+          getFunctionCatalog(tEnv),
+          name,
+          aggregateFunction.asInstanceOf[ImperativeAggregateFunction[Any, Any]])
+      case _ =>
+        tEnv.registerFunction(name, function.asInstanceOf[ScalarFunction])
+    }
+  }
+
+  // the field is looked up once as the reflective lookup is much more expensive than the access
+  private lazy val functionCatalogField = {
+    val field = classOf[TableEnvironmentImpl].getDeclaredField("functionCatalog")
+    field.setAccessible(true)
+    field
+  }
+
+  private def getFunctionCatalog(tEnv: TableEnvironment): FunctionCatalog = {
+    functionCatalogField.get(tEnv).asInstanceOf[FunctionCatalog]
+  }
+
+  private def registerTableFunction[T](
+      functionCatalog: FunctionCatalog,
+      name: String,
+      function: TableFunction[T]): Unit = {
+    functionCatalog.registerTempSystemTableFunction(
+      name,
+      function,
+      UserDefinedFunctionHelper.getReturnTypeOfTableFunction(function))
+  }
+
+  private def registerAggregateFunction[T, ACC](
+      functionCatalog: FunctionCatalog,
+      name: String,
+      function: ImperativeAggregateFunction[T, ACC]): Unit = {
+    functionCatalog.registerTempSystemAggregateFunction(
+      name,
+      function,
+      UserDefinedFunctionHelper.getReturnTypeOfAggregateFunction(function),
+      UserDefinedFunctionHelper.getAccumulatorTypeOfAggregateFunction(function))
+  }
+
   def getOffsetFromLocalMillis(millisLocal: Long): Int = {
     val localZone = TimeZone.getDefault
     var result = localZone.getRawOffset